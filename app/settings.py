@@ -179,6 +179,10 @@ LOGGING = {
     },
 }
 
+# Hashdiff algorithm used by HashService for SCD2 change detection: 'sha256' or 'blake2b'.
+# Changing it on an existing database requires recomputing stored hashdiffs.
+HASHSERVICE_ALGO = env.str('HASHSERVICE_ALGO', default='sha256')
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -101,6 +101,9 @@ STATIC_URL = '/test_static/'
 # Disable password validation for faster user creation in tests
 AUTH_PASSWORD_VALIDATORS = []
 
+# Fast (insecure) hasher: PBKDF2 dominates create_user() time in fixtures
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 # Test timezone
 TIME_ZONE = 'UTC'
 USE_TZ = True
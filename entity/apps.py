@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class EntityConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'entity'
+
+    def ready(self) -> None:
+        from entity import signals  # noqa: F401
+        from services import checks  # noqa: F401
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entity', '0006_alter_entity_entity_type_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='entity',
+            index=models.Index(fields=['entity_uid', 'valid_from', 'valid_to'], name='ent_uid_validity_idx'),
+        ),
+    ]
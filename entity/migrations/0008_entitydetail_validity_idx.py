@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entity', '0007_entity_uid_validity_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='entitydetail',
+            index=models.Index(fields=['entity', 'valid_from', 'valid_to'], name='det_ent_validity_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:38
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entity', '0008_entitydetail_validity_idx'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='entity',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['display_name'], name='ent_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
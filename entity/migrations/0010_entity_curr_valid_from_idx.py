@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entity', '0009_entity_name_trgm_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='entity',
+            index=models.Index(condition=models.Q(('is_current', True)), fields=['-valid_from'], name='ent_curr_valid_from_idx'),
+        ),
+    ]
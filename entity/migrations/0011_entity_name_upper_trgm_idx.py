@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:07
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entity', '0010_entity_curr_valid_from_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='entity',
+            name='ent_name_trgm_idx',
+        ),
+        migrations.AddIndex(
+            model_name='entity',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('display_name'), name='gin_trgm_ops'), name='ent_name_upper_trgm_idx'),
+        ),
+    ]
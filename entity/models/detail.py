@@ -55,6 +55,11 @@ class EntityDetail(models.Model):
                 fields=['hashdiff'],
                 include=['entity', 'detail_type', 'detail_value'],
                 name='det_hashdiff_cov_idx'),
+            # Point-in-time lookup of an entity's details (as-of queries)
+            models.Index(
+                fields=['entity', 'valid_from', 'valid_to'],
+                name='det_ent_validity_idx'
+            ),
         ]
         constraints = [
             UniqueConstraint(
@@ -82,7 +87,8 @@ class EntityDetail(models.Model):
         return f"{self.detail_type.code}: {self.detail_value}"
 
     def save(self, *args: Any, **kwargs: Any) -> None:
-        components = [self.detail_value, str(self.detail_type.code)]
+        # DetailType is keyed by code, so detail_type_id avoids fetching the related row
+        components = [self.detail_value, str(self.detail_type_id)]
         self.hashdiff = HashService.compute(components)
         super().save(*args, **kwargs)
 
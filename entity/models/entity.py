@@ -1,9 +1,11 @@
 import uuid
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
 from django.db.models import F, Func, Q, UniqueConstraint, Value
+from django.db.models.functions import Upper
 from django.utils import timezone
 
 from services.hash import HashService
@@ -11,6 +13,10 @@ from services.hash import HashService
 from .type import EntityType
 
 
+if TYPE_CHECKING:
+    from .detail import EntityDetail
+
+
 class Entity(models.Model):
     """
     Represents a person, institution, or other entity.
@@ -33,6 +39,10 @@ class Entity(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    if TYPE_CHECKING:
+        # Current details, set by the Prefetch(to_attr="current_details") lookups and by EntityService writes
+        current_details: list[EntityDetail]
+
     class Meta:
         db_table = "entity"
         indexes = [
@@ -61,6 +71,23 @@ class Entity(models.Model):
                 include=["entity_uid", "entity_type", "is_current", "valid_from"],
                 name="ent_name_cov_idx",
             ),
+            # Point-in-time lookup of one entity (as-of queries)
+            models.Index(
+                fields=["entity_uid", "valid_from", "valid_to"],
+                name="ent_uid_validity_idx",
+            ),
+            # Keyset (?cursor=) pages over current versions walk this index instead of sorting
+            models.Index(
+                fields=["-valid_from"],
+                condition=Q(is_current=True),
+                name="ent_curr_valid_from_idx",
+            ),
+            # Trigram index on the expression display_name__icontains compiles to on PostgreSQL,
+            # UPPER(display_name::text) LIKE UPPER('%q%'); a bare-column index cannot serve it
+            GinIndex(
+                OpClass(Upper("display_name"), name="gin_trgm_ops"),
+                name="ent_name_upper_trgm_idx",
+            ),
         ]
         ordering = ["-valid_from"]
         constraints = [
@@ -91,8 +118,9 @@ class Entity(models.Model):
 
     def save(self, *args: Any, **kwargs: Any) -> None:
         """Override save to auto-calculate hashdiff."""
-        if self.display_name and self.entity_type:
+        # EntityType is keyed by code, so entity_type_id avoids fetching the related row
+        if self.display_name and self.entity_type_id:
             self.hashdiff = HashService.compute(
-                [str(self.display_name), str(self.entity_type.code)]
+                [str(self.display_name), str(self.entity_type_id)]
             )
         super().save(*args, **kwargs)
@@ -1,11 +1,29 @@
-from typing import Any
+import copy
+from typing import Any, ClassVar
 
+from django.db.models import Prefetch, QuerySet
 from rest_framework import serializers
 
 from entity.models import DetailType, Entity, EntityDetail, EntityType
 
 
-class EntityDetailSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """Build ModelSerializer fields once per class and hand each instance its own copy."""
+
+    # Set per concrete serializer class on first use; subclasses never share the parent's fields
+    _cached_fields: ClassVar[dict[str, serializers.Field]]
+
+    def get_fields(self) -> dict[str, Any]:
+        cls = type(self)
+        # Model introspection in ModelSerializer.get_fields() is the expensive part; the result does not
+        # depend on the instance, so compute it once per class
+        if "_cached_fields" not in cls.__dict__:
+            cls._cached_fields = super().get_fields()
+        # Deep copy like DRF does for declared fields: binding mutates fields and nested serializers
+        return copy.deepcopy(cls._cached_fields)
+
+
+class EntityDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     detail_type = serializers.SlugRelatedField(
         slug_field="code",
         queryset=DetailType.objects.filter(is_active=True),
@@ -37,7 +55,7 @@ class EntityDetailSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(msg)
         return value
 
-class EntitySerializer(serializers.ModelSerializer):
+class EntitySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     entity_type = serializers.SlugRelatedField(
         slug_field="code",
         queryset=EntityType.objects.filter(is_active=True),
@@ -70,6 +88,36 @@ class EntitySerializer(serializers.ModelSerializer):
             "hashdiff"
         ]
 
+    # Only the columns rendered on read; entity and detail types contribute just their code
+    ENTITY_READ_FIELDS = (
+        "id", "entity_uid", "display_name", "entity_type__code",
+        "valid_from", "valid_to", "is_current", "hashdiff",
+    )
+    DETAIL_READ_FIELDS = (
+        "id", "entity", "detail_type__code", "detail_value",
+        "valid_from", "valid_to", "is_current", "hashdiff",
+    )
+
+    @classmethod
+    def setup_eager_loading(cls, queryset: QuerySet[Entity]) -> QuerySet[Entity]:
+        """Attach the joins and prefetches this serializer reads, so views cannot drift from its fields."""
+        return queryset.select_related("entity_type").only(*cls.ENTITY_READ_FIELDS).prefetch_related(
+            *cls.get_prefetches()
+        )
+
+    @classmethod
+    def get_prefetches(cls) -> list[Prefetch]:
+        """Prefetches for get_entity_details; also usable on already loaded instances."""
+        return [
+            Prefetch(
+                "details",
+                queryset=EntityDetail.objects.filter(
+                    is_current=True
+                ).select_related("detail_type").only(*cls.DETAIL_READ_FIELDS),
+                to_attr="current_details",
+            )
+        ]
+
     def create(self, validated_data: dict) -> dict:
         """Create entity with details, converting DetailType objects to codes."""
         return self._convert_detail_types(validated_data)
@@ -80,16 +128,10 @@ class EntitySerializer(serializers.ModelSerializer):
 
     def _convert_detail_types(self, validated_data: dict) -> dict:
         """Convert DetailType objects to codes for service."""
-        details_data = validated_data.pop('details', [])
-
-        # Convert DetailType objects to codes for service
-        if details_data:
-            for detail in details_data:
-                if hasattr(detail['detail_type'], 'code'):
-                    detail['detail_type'] = detail['detail_type'].code
-
-        # Add details back to validated_data
-        validated_data['details'] = details_data
+        # Convert in place; the service consumes validated_data directly
+        for detail in validated_data.setdefault('details', []):
+            if hasattr(detail['detail_type'], 'code'):
+                detail['detail_type'] = detail['detail_type'].code
 
         return validated_data
 
@@ -99,6 +141,10 @@ class EntitySerializer(serializers.ModelSerializer):
         if hasattr(obj, 'valid_details'):
             return EntityDetailSerializer(obj.valid_details, many=True).data
 
+        # Use prefetched current_details if available (list view, service results)
+        if hasattr(obj, 'current_details'):
+            return EntityDetailSerializer(obj.current_details, many=True).data
+
         # Fallback to current details for regular queries
         current_details = obj.details.filter(is_current=True).select_related('detail_type')
         return EntityDetailSerializer(current_details, many=True).data
@@ -111,6 +157,11 @@ class EntityListQuerySerializer(serializers.Serializer):
         required=False,
         help_text="Page number for pagination"
     )
+    cursor = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        help_text="Opaque keyset pagination cursor; send empty for the first page"
+    )
     q = serializers.CharField(
         max_length=255,
         required=False,
@@ -1,7 +1,11 @@
-from datetime import datetime
+import hashlib
+import uuid
+from datetime import datetime, timedelta
 from typing import Any
 
+from django.core.cache import cache
 from django.db.models import Prefetch, Q, QuerySet
+from django.utils import timezone
 
 from entity.models import Entity, EntityDetail
 
@@ -9,6 +13,41 @@ from entity.models import Entity, EntityDetail
 class AsOfService:
     """Service for retrieving entity state at specific point in time."""
 
+    # Columns read when building a single-entity snapshot dict
+    SNAPSHOT_ENTITY_FIELDS = (
+        'entity_uid', 'display_name', 'entity_type__code', 'valid_from', 'valid_to', 'hashdiff',
+    )
+    SNAPSHOT_DETAIL_FIELDS = (
+        'entity', 'detail_type__code', 'detail_value', 'valid_from', 'valid_to', 'hashdiff',
+    )
+
+    # As-of responses are cached for this long. Only past snapshots are cached: SCD2 writes close and open
+    # versions at the current time, so they never change what an older as_of returns
+    CACHE_TIMEOUT = 60
+    # Writes stamp valid_from/valid_to before they commit; younger instants may still gain rows
+    CACHE_MIN_AGE = timedelta(minutes=5)
+    # Rotated when rows are edited or deleted in place (admin, PUT/DELETE); with a per-process backend
+    # such as the default LocMemCache other workers still see those edits only after CACHE_TIMEOUT
+    CACHE_VERSION_KEY = 'asof:version'
+
+    @classmethod
+    def cache_key(cls, *parts: Any) -> str:
+        """Build a fixed-length cache key scoped to the current data version."""
+        version = cache.get_or_set(cls.CACHE_VERSION_KEY, lambda: uuid.uuid4().hex, None)
+        # Parts such as the request URL are unbounded, so only their digest goes into the key
+        digest = hashlib.sha256('|'.join(map(str, parts)).encode('utf-8'), usedforsecurity=False).hexdigest()
+        return f'asof:{version}:{digest}'
+
+    @classmethod
+    def is_cacheable(cls, as_of_date: datetime) -> bool:
+        """Whether the snapshot at as_of_date is old enough to be cached."""
+        return as_of_date <= timezone.now() - cls.CACHE_MIN_AGE
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Orphan every cached as-of result by rotating the version token."""
+        cache.set(cls.CACHE_VERSION_KEY, uuid.uuid4().hex, None)
+
     @staticmethod
     def get_entities_as_of(as_of_date: datetime) -> QuerySet[Entity]:
         """Get entities and details as they existed at the specified date."""
@@ -29,43 +68,42 @@ class AsOfService:
     @staticmethod
     def get_entity_as_of(entity_uid: str, as_of_date: datetime) -> dict[str, Any] | None:
         """Get specific entity and details as they existed at the specified date."""
-        try:
-            # Optimized query with prefetch_related to avoid N+1 problem
-            details_filter = Q(valid_from__lte=as_of_date) & (Q(valid_to__isnull=True) | Q(valid_to__gt=as_of_date))
-
-            entity = Entity.objects.filter(
-                entity_uid=entity_uid,
-                valid_from__lte=as_of_date
-            ).filter(
-                Q(valid_to__isnull=True) | Q(valid_to__gt=as_of_date)
-            ).select_related('entity_type').prefetch_related(
-                Prefetch(
-                    'details',
-                    queryset=EntityDetail.objects.filter(details_filter).select_related('detail_type'),
-                    to_attr='valid_details'
-                )
-            ).first()
+        # Single filter() call with one validity Q; served by ent_uid_validity_idx
+        validity = Q(valid_from__lte=as_of_date) & (Q(valid_to__isnull=True) | Q(valid_to__gt=as_of_date))
 
-            if not entity:
-                return None
+        # first() returns None for a missing entity, so no DoesNotExist handling is needed
+        entity = Entity.objects.filter(
+            validity, entity_uid=entity_uid
+        ).select_related('entity_type').only(
+            *AsOfService.SNAPSHOT_ENTITY_FIELDS
+        ).prefetch_related(
+            Prefetch(
+                'details',
+                queryset=EntityDetail.objects.filter(validity).select_related('detail_type').only(
+                    *AsOfService.SNAPSHOT_DETAIL_FIELDS
+                ),
+                to_attr='valid_details'
+            )
+        ).first()
 
-            return {
-                'entity_uid': entity.entity_uid,
-                'display_name': entity.display_name,
-                'entity_type': entity.entity_type.code if entity.entity_type else None,
-                'valid_from': entity.valid_from,
-                'valid_to': entity.valid_to,
-                'hashdiff': entity.hashdiff,
-                'details': [
-                    {
-                        'detail_type': detail.detail_type.code if detail.detail_type else None,
-                        'detail_value': detail.detail_value,
-                        'valid_from': detail.valid_from,
-                        'valid_to': detail.valid_to,
-                        'hashdiff': detail.hashdiff,
-                    }
-                    for detail in entity.valid_details
-                ]
-            }
-        except Entity.DoesNotExist:
+        if not entity:
             return None
+
+        return {
+            'entity_uid': entity.entity_uid,
+            'display_name': entity.display_name,
+            'entity_type': entity.entity_type.code if entity.entity_type else None,
+            'valid_from': entity.valid_from,
+            'valid_to': entity.valid_to,
+            'hashdiff': entity.hashdiff,
+            'details': [
+                {
+                    'detail_type': detail.detail_type.code if detail.detail_type else None,
+                    'detail_value': detail.detail_value,
+                    'valid_from': detail.valid_from,
+                    'valid_to': detail.valid_to,
+                    'hashdiff': detail.hashdiff,
+                }
+                for detail in entity.valid_details
+            ]
+        }
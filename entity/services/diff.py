@@ -10,6 +10,9 @@ from entity.models.audit import AuditLog
 class DiffService:
     """Service for comparing entity states between two points in time using AuditLog."""
 
+    # Columns read by _extract_changes_from_audit_entry and the grouping loop
+    AUDIT_FIELDS = ('entity_uid', 'operation', 'before_value', 'after_value', 'timestamp')
+
     @staticmethod
     def get_entities_diff(from_date: datetime, to_date: datetime) -> list[dict[str, Any]]:
         """
@@ -26,7 +29,7 @@ class DiffService:
         audit_entries = AuditLog.objects.filter(
             timestamp__gte=from_date,
             timestamp__lte=to_date
-        ).select_related('actor').order_by('entity_uid', 'timestamp')
+        ).only(*DiffService.AUDIT_FIELDS).order_by('entity_uid', 'timestamp')
 
         # Group changes by entity_uid
         entity_changes = defaultdict(list)
@@ -122,7 +125,7 @@ class DiffService:
             entity_uid=entity_uid,
             timestamp__gte=from_date,
             timestamp__lte=to_date
-        ).select_related('actor').order_by('timestamp')
+        ).only(*DiffService.AUDIT_FIELDS).order_by('timestamp')
 
         changes = []
         for entry in audit_entries:
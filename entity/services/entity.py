@@ -1,13 +1,15 @@
+from datetime import datetime
 from typing import Any
 
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import Prefetch, QuerySet
 from django.db.models.fields import UUIDField
 from django.utils import timezone
 
 from entity.models import DetailType, Entity, EntityDetail
-from services.audit import AuditService
+from services.audit import AuditBuffer
 from services.hash import HashService
 from services.scd2 import SCD2Service
 
@@ -38,31 +40,43 @@ class EntityService:
         return entity_data, details_data
 
     @staticmethod
-    def _get_detail_type(detail_type_code: str) -> DetailType:
-        """Get DetailType by code or raise validation error."""
-        try:
-            return DetailType.objects.get(code=detail_type_code)
-        except DetailType.DoesNotExist as err:
+    def _build_entity_snapshot(entity_data: dict[str, Any]) -> dict[str, str]:
+        """Builds the hashed/audited view of entity fields once, in hashdiff component order."""
+        return {
+            "display_name": str(entity_data["display_name"]),
+            "entity_type": str(entity_data["entity_type"].code),
+        }
+
+    @staticmethod
+    def _load_detail_types(details_data: list[dict[str, str]]) -> dict[str, DetailType]:
+        """Fetch every DetailType referenced by details_data in one query, keyed by code."""
+        codes = {detail["detail_type"] for detail in details_data}
+        detail_types: dict[str, DetailType] = DetailType.objects.in_bulk(codes, field_name="code")
+        for detail_type_code in codes - detail_types.keys():
             msg = f"DetailType with code '{detail_type_code}' not found"
-            raise ValidationError(msg) from err
+            raise ValidationError(msg)
+        return detail_types
 
     @staticmethod
     def _create_detail_instance(
         entity: Entity,
         detail_type: DetailType,
         detail_value: str,
-        user: User
+        user: User,
+        audit: AuditBuffer
     ) -> EntityDetail:
-        """Creates EntityDetail instance with common parameters."""
+        """Builds an unsaved EntityDetail instance with common parameters, ready for bulk_create."""
         entity_detail = EntityDetail(
             entity=entity,
             detail_type=detail_type,
             detail_value=detail_value,
+            # bulk_create bypasses save(), so hashdiff is set here
+            hashdiff=HashService.compute([detail_value, str(detail_type.code)]),
             valid_from=entity.valid_from,
             valid_to=None,
             is_current=True,
         )
-        AuditService.log_detail_change(
+        audit.log_detail_change(
             entity_uid=entity.entity_uid,
             operation="INSERT",
             user=user,
@@ -73,7 +87,6 @@ class EntityService:
             },
             request_context={}
         )
-        entity_detail.save()
         return entity_detail
 
     @staticmethod
@@ -83,81 +96,173 @@ class EntityService:
         return new_hashdiff == old_detail.hashdiff
 
     @transaction.atomic
-    def create(self, data: dict[str, Any], user: User) -> Entity:
-        """Creates Entity with/without details, handling scenarios 1 & 2."""
+    def create(self, data: dict[str, Any], user: User, *, now: datetime | None = None) -> Entity:
+        """
+        Creates Entity with/without details, handling scenarios 1 & 2.
+
+        `now` overrides valid_from (e.g. for backfills or tests); defaults to the current time.
+        The returned entity carries `current_details`.
+        """
         entity_data, details_data = self._parse_input_data(data)
         entity_type = entity_data["entity_type"]
+        snapshot = self._build_entity_snapshot(entity_data)
         entity = Entity(
             display_name=entity_data["display_name"],
             entity_type=entity_type,
-            valid_from=timezone.now(),
+            valid_from=now or timezone.now(),
             valid_to=None,
             is_current=True,
         )
         entity.save()
-        # Create audit log
-        AuditService.log_entity_change(
-            entity_uid=entity.entity_uid,
-            operation="INSERT",
-            user=user,
-            before_data={},
-            after_data={
-                "display_name": entity.display_name,
-                "entity_type": entity.entity_type.code,
-            },
-            request_context={}
-        )
+        # A brand-new entity has no other details; callers can render it without querying them back
+        entity.current_details = []
+        with AuditBuffer() as audit:
+            # Create audit log
+            audit.log_entity_change(
+                entity_uid=entity.entity_uid,
+                operation="INSERT",
+                user=user,
+                before_data={},
+                after_data=snapshot,
+                request_context={}
+            )
 
-        if details_data:
-            for detail in details_data:
-                detail_type = self._get_detail_type(detail["detail_type"])
-                # Create detail and save instance and log audit
-                self._create_detail_instance(
-                    entity,
-                    detail_type,
-                    detail["detail_value"],
-                    user)
+            if details_data:
+                detail_types = self._load_detail_types(details_data)
+                # Build detail instances and queue audit, then insert them in one query
+                entity.current_details = EntityDetail.objects.bulk_create([
+                    self._create_detail_instance(
+                        entity,
+                        detail_types[detail["detail_type"]],
+                        detail["detail_value"],
+                        user,
+                        audit)
+                    for detail in details_data
+                ])
 
         return entity
 
     @transaction.atomic
-    def update(self, entity_uid: UUIDField, data: dict[str, Any], user: User) -> Entity:
-        """Updates Entity with/without details, handling scenarios 3, 4 & 5."""
+    def bulk_create(self, batch: list[dict[str, Any]], user: User, *, now: datetime | None = None) -> list[Entity]:
+        """
+        Creates many entities with their details for high-throughput ingestion.
+
+        Issues one multi-row INSERT per table (entities, details, audit log)
+        instead of per-row saves; single-entity callers should keep using create().
+        The returned entities carry `current_details`, as with create().
+        """
+        now = now or timezone.now()
+        parsed = [self._parse_input_data(data) for data in batch]
+        # Unknown detail type codes are rejected before anything is inserted
+        detail_types = self._load_detail_types([detail for _, details_data in parsed for detail in details_data])
+
+        entities = []
+        with AuditBuffer() as audit:
+            for entity_data, _ in parsed:
+                snapshot = self._build_entity_snapshot(entity_data)
+                entity = Entity(
+                    display_name=entity_data["display_name"],
+                    entity_type=entity_data["entity_type"],
+                    valid_from=now,
+                    valid_to=None,
+                    is_current=True,
+                )
+                # bulk_create bypasses save(), so hashdiff is set here
+                entity.hashdiff = HashService.compute(snapshot.values())
+                entities.append(entity)
+                audit.log_entity_change(
+                    entity_uid=entity.entity_uid,
+                    operation="INSERT",
+                    user=user,
+                    before_data={},
+                    after_data=snapshot,
+                )
+            Entity.objects.bulk_create(entities)
+
+            details = []
+            for entity, (_, details_data) in zip(entities, parsed, strict=True):
+                entity.current_details = [
+                    self._create_detail_instance(
+                        entity,
+                        detail_types[detail["detail_type"]],
+                        detail["detail_value"],
+                        user,
+                        audit)
+                    for detail in details_data
+                ]
+                details.extend(entity.current_details)
+            EntityDetail.objects.bulk_create(details)
+
+        return entities
+
+    @transaction.atomic
+    def update(
+        self, entity_uid: UUIDField, data: dict[str, Any], user: User, *, now: datetime | None = None,
+        current_entity: Entity | None = None
+    ) -> Entity:
+        """
+        Updates Entity with/without details, handling scenarios 3, 4 & 5.
+
+        `now` is the version transition timestamp shared by the entity and all its detail rows;
+        defaults to the current time. `current_entity` may be passed when the caller already loaded it
+        from `current_entities()`, saving the lookup. The returned version carries `current_details`.
+        """
         entity_data, details_data = self._parse_input_data(data)
-        current_entity = self._get_current_entity(entity_uid)
+        if current_entity is None:
+            current_entity = self._get_current_entity(entity_uid)
+        snapshot = self._build_entity_snapshot(entity_data)
+        current_details = {d.detail_type_id: d for d in current_entity.current_details}
 
-        if self._is_entity_unchanged(current_entity, entity_data, details_data):
+        # No-op updates are decided from the prefetched rows alone, before any DetailType lookup
+        if self._is_entity_unchanged(current_entity, snapshot, details_data, current_details):
             return current_entity
 
-        new_entity = self._create_new_entity_version(current_entity, entity_data)
-        self._synchronize_details(current_entity, new_entity, details_data, user)
+        detail_types = self._load_detail_types(details_data)
+        new_entity = self._create_new_entity_version(current_entity, entity_data, now or timezone.now())
+        with AuditBuffer() as audit:
+            self._synchronize_details(
+                current_entity, new_entity, details_data, detail_types, current_details, user, audit
+            )
 
         return new_entity
 
+    @staticmethod
+    def current_entities() -> QuerySet[Entity]:
+        """Current entity versions with their current details prefetched, as update() expects them."""
+        queryset: QuerySet[Entity] = Entity.objects.filter(is_current=True).prefetch_related(
+            Prefetch(
+                "details",
+                queryset=EntityDetail.objects.filter(is_current=True).select_related("detail_type"),
+                to_attr="current_details",
+            )
+        )
+        return queryset
+
     def _get_current_entity(self, entity_uid: UUIDField) -> Entity:
-        """Get current entity or raise validation error."""
-        try:
-            return Entity.objects.get(entity_uid=entity_uid, is_current=True)
-        except Entity.DoesNotExist as err:
+        """Get current entity with its current details prefetched, or raise validation error."""
+        # Served by the partial unique index behind unique_current_entity
+        current_entity: Entity | None = self.current_entities().filter(entity_uid=entity_uid).first()
+        if current_entity is None:
             msg = f"Entity with entity_uid {entity_uid} not found"
-            raise ValidationError(msg) from err
+            raise ValidationError(msg)
+        return current_entity
 
-    def _is_entity_unchanged(self, current_entity: Entity, entity_data: dict[str, Any], details_data: list) -> bool:
-        entity_type = entity_data["entity_type"]
-        new_hashdiff = HashService.compute(
-            [str(entity_data["display_name"]), str(entity_type.code)]
-        )
-        entity_unchanged = new_hashdiff == current_entity.hashdiff
+    def _is_entity_unchanged(
+        self, current_entity: Entity, snapshot: dict[str, str], details_data: list, current_details: dict
+    ) -> bool:
+        # Exact field equality implies an equal hash; only fall back to hashing when it can't decide
+        entity_unchanged = (
+            current_entity.display_name == snapshot["display_name"]
+            and current_entity.entity_type_id == snapshot["entity_type"]
+        ) or HashService.compute(snapshot.values()) == current_entity.hashdiff
 
         if not details_data:
             return entity_unchanged
 
-        details_unchanged = self._are_details_unchanged(current_entity, details_data)
+        details_unchanged = self._are_details_unchanged(details_data, current_details)
         return entity_unchanged and details_unchanged
 
-    def _are_details_unchanged(self, current_entity: Entity, details_data: list) -> bool:
-        current_details = {d.detail_type.code: d for d in current_entity.details.filter(is_current=True)}
-
+    def _are_details_unchanged(self, details_data: list, current_details: dict) -> bool:
         if len(details_data) != len(current_details):
             return False
 
@@ -168,89 +273,124 @@ class EntityService:
             if detail_type_code not in current_details:
                 return False
 
+            # Matching codes means the prefetched (select_related) detail_type is the one requested
             current_detail = current_details[detail_type_code]
-            detail_type = self._get_detail_type(detail_type_code)
 
-            if not self._is_detail_unchanged(current_detail, detail_type, new_detail_value):
+            if not self._is_detail_unchanged(current_detail, current_detail.detail_type, new_detail_value):
                 return False
 
         return True
 
-    def _create_new_entity_version(self, current_entity: Entity, entity_data: dict[str, Any]) -> Entity:
+    def _create_new_entity_version(self, current_entity: Entity, entity_data: dict[str, Any], now: datetime) -> Entity:
         entity_type = entity_data["entity_type"]
         old_entity, new_entity = SCD2Service.create_new_version(
             current_entity,
+            now,
             display_name=entity_data["display_name"],
             entity_type=entity_type
         )
-        old_entity.save()
+        # Close the current version with a narrow UPDATE; save() would rewrite every column and rehash
+        Entity.objects.filter(pk=old_entity.pk).update(
+            valid_to=old_entity.valid_to, is_current=False, updated_at=old_entity.updated_at
+        )
         new_entity.save()
         return new_entity
 
-    def _synchronize_details(self, current_entity: Entity, new_entity: Entity, details_data: list, user: User) -> None:
-        current_details = {d.detail_type.code: d for d in current_entity.details.filter(is_current=True)}
+    def _synchronize_details(
+        self, current_entity: Entity, new_entity: Entity, details_data: list, detail_types: dict,
+        current_details: dict, user: User, audit: AuditBuffer
+    ) -> None:
+        if not details_data:
+            new_entity.current_details = self._copy_existing_details(current_entity, new_entity)
+            return
 
-        if details_data:
-            self._process_provided_details(new_entity, current_details, details_data, user)
-            self._close_unprovided_details(new_entity, current_details, details_data)
-        else:
-            self._copy_existing_details(new_entity, current_details)
+        to_close, to_insert = self._process_provided_details(
+            new_entity, current_details, details_data, detail_types, user, audit
+        )
+        carried_close, carried_insert = self._close_unprovided_details(new_entity, current_details, details_data)
+        to_close += carried_close
+        to_insert += carried_insert
+
+        # One UPDATE for every closed row and one INSERT for every new row; closed rows all share
+        # the new version's timestamp, so a plain UPDATE replaces bulk_update's per-row CASE
+        now = new_entity.valid_from
+        EntityDetail.objects.filter(pk__in=[d.pk for d in to_close]).update(
+            valid_to=now, is_current=False, updated_at=now
+        )
+        # Every current detail of the new version was inserted here, with its detail_type attached
+        new_entity.current_details = EntityDetail.objects.bulk_create(to_insert)
 
     def _process_provided_details(
-        self, new_entity: Entity, current_details: dict, details_data: list, user: User
-    ) -> None:
+        self, new_entity: Entity, current_details: dict, details_data: list, detail_types: dict, user: User,
+        audit: AuditBuffer
+    ) -> tuple[list[EntityDetail], list[EntityDetail]]:
+        """Collects detail rows to close and to insert; the caller writes them in bulk."""
+        to_close, to_insert = [], []
         for detail in details_data:
-            detail_type = self._get_detail_type(detail["detail_type"])
+            detail_type = detail_types[detail["detail_type"]]
             new_detail_value = detail["detail_value"]
             old_detail = current_details.get(detail_type.code)
 
             if old_detail:
-                self._update_existing_detail(old_detail, new_entity, detail_type, new_detail_value, user)
+                closed_detail, new_detail = self._update_existing_detail(
+                    old_detail, new_entity, detail_type, new_detail_value, user, audit
+                )
+                if closed_detail:
+                    to_close.append(closed_detail)
             else:
-                self._create_new_detail(new_entity, detail_type, new_detail_value, user)
+                new_detail = self._create_detail_instance(new_entity, detail_type, new_detail_value, user, audit)
+            to_insert.append(new_detail)
+        return to_close, to_insert
 
-    def _update_existing_detail(self, old_detail: EntityDetail, new_entity: Entity,
-                                detail_type: DetailType, new_detail_value: str, user: User) -> None:
+    def _update_existing_detail(self, old_detail: EntityDetail, new_entity: Entity, detail_type: DetailType,
+                                new_detail_value: str, user: User,
+                                audit: AuditBuffer) -> tuple[EntityDetail | None, EntityDetail]:
         if self._is_detail_unchanged(old_detail, detail_type, new_detail_value):
             # Scenario 4: Detail unchanged, just copy with new entity reference
-            new_detail = self._create_detail_instance(new_entity, detail_type, new_detail_value, user)
-            new_detail.save()
-        else:
-            # Scenario 5: Detail changed, use SCD2 to close old and create new
-            old_detail, new_detail = SCD2Service.create_new_version(
-                old_detail,
-                entity=new_entity,
-                detail_type=detail_type,
-                detail_value=new_detail_value
-            )
-            old_detail.save()
-            new_detail.save()
+            return None, self._create_detail_instance(new_entity, detail_type, new_detail_value, user, audit)
 
-    def _create_new_detail(self, new_entity: Entity, detail_type: DetailType, detail_value: str, user: User) -> None:
-        new_detail = self._create_detail_instance(new_entity, detail_type, detail_value, user)
-        new_detail.save()
+        # Scenario 5: Detail changed, use SCD2 to close old and create new
+        old_detail, new_detail = SCD2Service.create_new_version(
+            old_detail,
+            new_entity.valid_from,
+            entity=new_entity,
+            detail_type=detail_type,
+            detail_value=new_detail_value
+        )
+        new_detail.hashdiff = HashService.compute([new_detail_value, str(detail_type.code)])
+        return old_detail, new_detail
 
-    def _close_unprovided_details(self, new_entity: Entity, current_details: dict, details_data: list) -> None:
+    def _close_unprovided_details(
+        self, new_entity: Entity, current_details: dict, details_data: list
+    ) -> tuple[list[EntityDetail], list[EntityDetail]]:
+        """Collects carried-over rows for details absent from the input; the caller writes them in bulk."""
         provided_detail_types = {d["detail_type"] for d in details_data}
+        to_close, to_insert = [], []
 
         for detail_type_code, old_detail in current_details.items():
             if detail_type_code not in provided_detail_types:
+                # Only the entity reference changes; value and hashdiff are copied as-is
                 old_detail, new_detail = SCD2Service.create_new_version(
-                    old_detail,
-                    entity=new_entity,
-                    detail_type=old_detail.detail_type,
-                    detail_value=old_detail.detail_value
+                    old_detail, new_entity.valid_from, entity=new_entity, detail_type=old_detail.detail_type
                 )
-                old_detail.save()
-                new_detail.save()
-
-    def _copy_existing_details(self, new_entity: Entity, current_details: dict) -> None:
-        for old_detail in current_details.values():
-            old_detail, new_detail = SCD2Service.create_new_version(
-                old_detail,
-                entity=new_entity,
-                detail_type=old_detail.detail_type,
-                detail_value=old_detail.detail_value
-            )
-            old_detail.save()
-            new_detail.save()
+                to_close.append(old_detail)
+                to_insert.append(new_detail)
+        return to_close, to_insert
+
+    def _copy_existing_details(self, current_entity: Entity, new_entity: Entity) -> list[EntityDetail]:
+        """Close current details with one UPDATE and carry their values over to the new version."""
+        now = new_entity.valid_from
+        # Values to carry come from the details prefetched with the current entity
+        carried = [
+            {"detail_type": d.detail_type, "detail_value": d.detail_value, "hashdiff": d.hashdiff}
+            for d in current_entity.current_details
+        ]
+
+        EntityDetail.objects.filter(entity=current_entity, is_current=True).update(
+            valid_to=now, is_current=False, updated_at=now
+        )
+        # bulk_create bypasses save(), so hashdiff is carried over as-is
+        copied: list[EntityDetail] = EntityDetail.objects.bulk_create(
+            EntityDetail(entity=new_entity, valid_from=now, **row) for row in carried
+        )
+        return copied
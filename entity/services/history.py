@@ -1,5 +1,6 @@
 from typing import Any
 
+from django.db.models import CharField, F, Value
 from django.db.models.fields import UUIDField
 
 from entity.models import Entity, EntityDetail
@@ -8,54 +9,55 @@ from entity.models import Entity, EntityDetail
 class HistoryService:
     """Service for retrieving combined historical data for entities."""
 
-    @staticmethod
-    def get_combined_history(entity_uid: UUIDField) -> list[dict[str, Any]]:
-        """Get chronological history of Entity and EntityDetail changes."""
-        history_entries = []
+    # Uniform row shape shared by both sides of the UNION
+    HISTORY_FIELDS = (
+        'row_type', 'valid_from', 'valid_to', 'is_current', 'created_at', 'updated_at',
+        'hashdiff', 'uid', 'change_code', 'change_value',
+    )
 
-        # Optimized: single query with proper ordering at DB level
+    @classmethod
+    def get_combined_history(cls, entity_uid: UUIDField) -> list[dict[str, Any]]:
+        """Get chronological history of Entity and EntityDetail changes."""
+        # Entity and detail versions are projected to the same columns and merged in one UNION query;
+        # DetailType/EntityType are keyed by code, so the FK ids are the codes and no JOIN is needed
         entity_versions = Entity.objects.filter(
             entity_uid=entity_uid
-        ).select_related('entity_type').order_by('valid_from')
+        ).annotate(
+            row_type=Value('entity', output_field=CharField()),
+            uid=F('entity_uid'),
+            change_code=F('entity_type_id'),
+            change_value=F('display_name'),
+        ).values(*cls.HISTORY_FIELDS).order_by()
 
         detail_versions = EntityDetail.objects.filter(
             entity__entity_uid=entity_uid
-        ).select_related('entity', 'detail_type').order_by('valid_from')
-
-        # Build entity history entries
-        for entity in entity_versions:
-            history_entries.append({
-                'type': 'entity',
-                'valid_from': entity.valid_from,
-                'valid_to': entity.valid_to,
-                'is_current': entity.is_current,
-                'created_at': entity.created_at,
-                'updated_at': entity.updated_at,
-                'changes': {
-                    'display_name': entity.display_name,
-                    'entity_type': entity.entity_type.code if entity.entity_type else None,
-                },
-                'hashdiff': entity.hashdiff,
-                'entity_uid': entity.entity_uid,
-            })
-
-        # Build detail history entries
-        for detail in detail_versions:
-            history_entries.append({
-                'type': 'detail',
-                'valid_from': detail.valid_from,
-                'valid_to': detail.valid_to,
-                'is_current': detail.is_current,
-                'created_at': detail.created_at,
-                'updated_at': detail.updated_at,
-                'changes': {
-                    'detail_type': detail.detail_type.code if detail.detail_type else None,
-                    'detail_value': detail.detail_value,
-                },
-                'hashdiff': detail.hashdiff,
-                'entity_uid': detail.entity.entity_uid,
-            })
-
-        # Sort merged results chronologically
-        history_entries.sort(key=lambda x: x['valid_from'])
-        return history_entries
+        ).annotate(
+            row_type=Value('detail', output_field=CharField()),
+            uid=F('entity__entity_uid'),
+            change_code=F('detail_type_id'),
+            change_value=F('detail_value'),
+        ).values(*cls.HISTORY_FIELDS).order_by()
+
+        # Sorted chronologically by the database; entity rows come before detail rows at the same instant
+        combined = entity_versions.union(detail_versions, all=True).order_by('valid_from', '-row_type')
+        return [cls._build_history_entry(row) for row in combined]
+
+    @staticmethod
+    def _build_history_entry(row: dict[str, Any]) -> dict[str, Any]:
+        """Map a UNION row to the history entry shape returned by the API."""
+        if row['row_type'] == 'entity':
+            changes = {'display_name': row['change_value'], 'entity_type': row['change_code']}
+        else:
+            changes = {'detail_type': row['change_code'], 'detail_value': row['change_value']}
+
+        return {
+            'type': row['row_type'],
+            'valid_from': row['valid_from'],
+            'valid_to': row['valid_to'],
+            'is_current': row['is_current'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at'],
+            'changes': changes,
+            'hashdiff': row['hashdiff'],
+            'entity_uid': row['uid'],
+        }
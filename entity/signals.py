@@ -0,0 +1,19 @@
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from entity.models import Entity, EntityDetail
+from entity.services import AsOfService
+
+
+@receiver(post_save, sender=Entity)
+@receiver(post_save, sender=EntityDetail)
+@receiver(post_delete, sender=Entity)
+@receiver(post_delete, sender=EntityDetail)
+def invalidate_asof_cache(**_kwargs: Any) -> None:
+    """Rotate the as-of cache version when a row is saved or deleted (admin, PUT/DELETE handlers)."""
+    # EntityService's bulk_create and queryset.update() send no signals; they only add versions from now on,
+    # which never changes the past snapshots AsOfService caches
+    transaction.on_commit(AsOfService.invalidate_cache)
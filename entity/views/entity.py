@@ -1,10 +1,16 @@
+from typing import cast
+
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
-from django.db.models import QuerySet
+from django.db.models import QuerySet, prefetch_related_objects
 from django.db.models.fields import UUIDField
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import APIException
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
@@ -14,7 +20,7 @@ from entity.serializers import EntityListQuerySerializer, EntitySerializer
 from entity.serializers.temporal import EntityHistorySerializer
 from entity.services import EntityService
 from entity.services.history import HistoryService
-from services import PaginationService
+from services import ORJSONRenderer, PaginationService
 
 
 class EntityViewSet(ModelViewSet):
@@ -23,6 +29,8 @@ class EntityViewSet(ModelViewSet):
     lookup_field = "entity_uid"
     queryset = Entity.objects.filter(is_current=True)
     serializer_class = EntitySerializer
+    # List and history pages are large; orjson encodes them several times faster than stdlib json
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
     def list(self, request: Request) -> Response:
         """Handles GET request to list and filter entities."""
@@ -31,28 +39,43 @@ class EntityViewSet(ModelViewSet):
         query_params = srz.validated_data
         queryset = self._build_filtered_queryset(query_params)
 
+        # ?cursor= opts into keyset pagination; ?page= keeps the OFFSET-based response with a count
+        if "cursor" in query_params:
+            return PaginationService.paginate_queryset_by_cursor(
+                queryset, request, EntitySerializer
+            )
+
         return PaginationService.paginate_queryset(
             queryset, request, EntitySerializer
         )
 
-    def retrieve(self, _: Request, entity_uid: UUIDField) -> Response:
+    def retrieve(self, request: Request, entity_uid: UUIDField) -> Response:
         """Handles GET request to retrieve a specific entity by UUID."""
         entity = get_object_or_404(
-            Entity.objects.select_related("entity_type").prefetch_related("details__detail_type"),
+            Entity.objects.select_related("entity_type").only(*EntitySerializer.ENTITY_READ_FIELDS),
             entity_uid=entity_uid,
             is_current=True
         )
-        return Response(EntitySerializer(entity).data)
+
+        # Every change creates a new current version, so the version row identifies the payload;
+        # an unchanged entity answers 304 before details are loaded or serialized
+        etag = self._build_etag(entity)
+        conditional = get_conditional_response(request, etag=etag)
+        if conditional is not None:
+            # Answered as a DRF Response (304, or 412 for a failed If-Match) carrying the validator (RFC 9110)
+            return Response(status=conditional.status_code, headers={"ETag": etag})
+
+        prefetch_related_objects([entity], *EntitySerializer.get_prefetches())
+        response = Response(EntitySerializer(entity).data)
+        response["ETag"] = etag
+        return response
 
     def create(self, request: Request) -> Response:
         """Handles POST request to create a new entity."""
         serializer = EntitySerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        # Ensure user is of correct type or None
-        if not (request.user.is_authenticated and isinstance(request.user, User)):
-            return Response(status=status.HTTP_401_UNAUTHORIZED)
-        user: User = request.user
+        user = cast("User", request.user)
 
         # Use serializer.save() to trigger the create method and get processed data
         processed_data = serializer.save()
@@ -69,10 +92,10 @@ class EntityViewSet(ModelViewSet):
         Returns 200 OK with updated entity data.
         """
         try:
+            # Loaded the way EntityService.update() needs it, so the service does not fetch it again
             entity = get_object_or_404(
-                Entity.objects.select_related("entity_type").prefetch_related("details__detail_type"),
-                entity_uid=entity_uid,
-                is_current=True
+                EntityService.current_entities().select_related("entity_type"),
+                entity_uid=entity_uid
             )
 
             serializer = EntitySerializer(
@@ -82,13 +105,20 @@ class EntityViewSet(ModelViewSet):
             )
             serializer.is_valid(raise_exception=True)
 
-            if not (request.user.is_authenticated and isinstance(request.user, User)):
-                return Response(status=status.HTTP_401_UNAUTHORIZED)
-            user: User = request.user
+            user = cast("User", request.user)
 
-            # Use serializer.save() to trigger conversion of DetailType objects to codes
-            processed_data = serializer.save()
-            updated_entity = EntityService().update(entity_uid, processed_data, user)
+            # Nothing to change: skip the SCD2 service round-trip and render the already loaded version
+            if not serializer.validated_data:
+                return Response(EntitySerializer(entity).data, status=status.HTTP_200_OK)
+
+            # Omitted fields keep their current values: the service versions the whole row and needs both.
+            # serializer.save() converts DetailType objects to codes
+            processed_data = {
+                "display_name": entity.display_name,
+                "entity_type": entity.entity_type,
+                **serializer.save(),
+            }
+            updated_entity = EntityService().update(entity_uid, processed_data, user, current_entity=entity)
 
             return Response(EntitySerializer(updated_entity).data, status=status.HTTP_200_OK)
 
@@ -97,6 +127,9 @@ class EntityViewSet(ModelViewSet):
                 {"error": str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        except (Http404, APIException):
+            # Serializer errors and a missing entity keep DRF's 400/404 responses
+            raise
         except Exception:
             return Response(
                 {"error": "Internal server error"},
@@ -106,24 +139,26 @@ class EntityViewSet(ModelViewSet):
     @action(detail=True, methods=["get"], url_path="history")
     def history(self, request: Request, entity_uid: UUIDField) -> Response:
         """Handles GET request to retrieve combined history for a specific entity."""
-        # Check if entity exists (any version)
-        if not Entity.objects.filter(entity_uid=entity_uid).exists():
+        # Every entity has at least one version row, so empty history means the entity does not exist
+        history_data = HistoryService.get_combined_history(entity_uid)
+        if not history_data:
             return Response(
                 {"error": f"Entity with UUID {entity_uid} not found"},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        history_data = HistoryService.get_combined_history(entity_uid)
-
         return PaginationService.paginate_queryset(
             history_data, request, EntityHistorySerializer
         )
 
+    @staticmethod
+    def _build_etag(entity: Entity) -> str:
+        """Build a strong ETag for the current version of an entity."""
+        return f'"{entity.pk}-{entity.hashdiff}"'
+
     def _build_filtered_queryset(self, params: dict) -> QuerySet[Entity]:
         """Build filtered queryset."""
-        queryset = Entity.objects.filter(is_current=True).select_related(
-            "entity_type"
-        ).prefetch_related("details__detail_type")
+        queryset = EntitySerializer.setup_eager_loading(Entity.objects.filter(is_current=True))
 
         if q := params.get("q"):
             queryset = queryset.filter(display_name__icontains=q)
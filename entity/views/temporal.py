@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -21,10 +22,27 @@ class AsOfAPIView(APIView):
         query_serializer.is_valid(raise_exception=True)
 
         as_of_date = query_serializer.validated_data['as_of']
+        cacheable = AsOfService.is_cacheable(as_of_date)
+        # Keyed on a digest of the full URL: it carries as_of and page, and the pagination links are built from it
+        cache_key = AsOfService.cache_key(request.build_absolute_uri())
+        if cacheable and (cached := cache.get(cache_key)) is not None:
+            return Response(cached)
+
         entities_queryset = AsOfService.get_entities_as_of(as_of_date)
-        return PaginationService.paginate_queryset(
-            entities_queryset, request, EntitySerializer, many=True
-        )
+        # Load only the entity columns EntitySerializer renders
+        only_fields = EntitySerializer.ENTITY_READ_FIELDS
+        # ?cursor= opts into keyset pagination like the entity list; ?page= keeps the counted response
+        if 'cursor' in request.query_params:
+            response = PaginationService.paginate_queryset_by_cursor(
+                entities_queryset, request, EntitySerializer, only_fields=only_fields
+            )
+        else:
+            response = PaginationService.paginate_queryset(
+                entities_queryset, request, EntitySerializer, many=True, only_fields=only_fields
+            )
+        if cacheable:
+            cache.set(cache_key, response.data, AsOfService.CACHE_TIMEOUT)
+        return response
 
 
 class DiffAPIView(APIView):
@@ -2,12 +2,15 @@ from .pagination import PaginationService
 from .scd2 import SCD2Service
 from .datetime import DateTimeService
 from .hash import HashService
-from .audit import AuditService
+from .audit import AuditBuffer, AuditService
+from .renderers import ORJSONRenderer
 
 __all__ = [
     "PaginationService",
     "SCD2Service",
     "DateTimeService",
     "HashService",
-    "AuditService"
+    "AuditService",
+    "AuditBuffer",
+    "ORJSONRenderer",
 ]
\ No newline at end of file
@@ -1,5 +1,7 @@
 import uuid
-from typing import Any
+from datetime import datetime
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
 
 from django.contrib.auth.models import User
 from django.db.models import UUIDField
@@ -8,12 +10,19 @@ from django.utils import timezone
 from entity.models.audit import AuditLog
 
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
 class AuditService:
     """
     Centralized service for handling audit logging across all modules.
     Tracks before/after values and creates audit records within transactions.
     """
 
+    # Entity fields compared by compare_entity_data
+    TRACKED_ENTITY_FIELDS = ('display_name', 'entity_type_id')
+
     @classmethod
     def log_entity_change(cls,
                         entity_uid: UUIDField,
@@ -88,18 +97,15 @@ class AuditService:
         if not request_id:
             request_id = str(uuid.uuid4())
 
-        audit_logs = []
+        entries = []
         for change in changes:
             change['request_context'] = change.get('request_context', {})
             change['request_context']['request_id'] = request_id
+            table_name = 'entity_detail' if change.get('detail_code') else 'entity'
+            entries.append({'table_name': table_name, **change})
 
-            if change.get('detail_code'):
-                audit_log = cls.log_detail_change(**change)
-            else:
-                audit_log = cls.log_entity_change(**change)
-            audit_logs.append(audit_log)
-
-        return audit_logs
+        # One multi-row INSERT for the whole batch
+        return cls.bulk_log(entries)
 
     @classmethod
     def compare_entity_data(cls, old_entity, new_data: dict[str, Any]) -> dict[str, dict[str, Any]]:
@@ -112,17 +118,16 @@ class AuditService:
         before = {}
         after = {}
 
-        # Fields to track for entities
-        tracked_fields = ['display_name', 'entity_type_id']
+        # Incoming values in TRACKED_ENTITY_FIELDS order; 'entity_type' takes precedence over 'entity_type_id'
+        # and may be an EntityType instance, so compare by its primary key (the code)
+        entity_type = new_data['entity_type'] if 'entity_type' in new_data else new_data.get('entity_type_id')
+        new_values = (
+            new_data.get('display_name'),
+            getattr(entity_type, 'pk', entity_type),
+        )
 
-        for field in tracked_fields:
+        for field, new_value in zip(cls.TRACKED_ENTITY_FIELDS, new_values, strict=True):
             old_value = getattr(old_entity, field, None)
-            new_value = new_data.get(field)
-
-            # Handle entity_type special case
-            if field == 'entity_type_id' and 'entity_type' in new_data:
-                new_value = new_data['entity_type']
-
             if old_value != new_value:
                 before[field] = old_value
                 after[field] = new_value
@@ -144,6 +149,20 @@ class AuditService:
             }
         return {}
 
+    @classmethod
+    def bulk_log(cls, entries: list[dict[str, Any]]) -> list[AuditLog]:
+        """
+        Create many audit log records with a single multi-row INSERT.
+
+        Args:
+            entries: list of dictionaries with _create_audit_log parameters
+                (entity_uid, table_name, operation, user, ...)
+        """
+        # One timestamp for the whole batch: the rows describe a single change
+        timestamp = timezone.now()
+        audit_logs = [cls._build_audit_log(**{'timestamp': timestamp, **entry}) for entry in entries]
+        return AuditLog.objects.bulk_create(audit_logs)
+
     @classmethod
     def _create_audit_log(cls,
                         entity_uid: UUIDField,
@@ -157,6 +176,33 @@ class AuditService:
         """
         Create audit log record with provided parameters.
         """
+        audit_log = cls._build_audit_log(
+            entity_uid=entity_uid,
+            table_name=table_name,
+            operation=operation,
+            user=user,
+            detail_code=detail_code,
+            before_data=before_data,
+            after_data=after_data,
+            request_context=request_context
+        )
+        audit_log.save()
+        return audit_log
+
+    @classmethod
+    def _build_audit_log(cls,
+                        entity_uid: UUIDField,
+                        table_name: str,
+                        operation: str,
+                        user: User,
+                        detail_code: str | None = None,
+                        before_data: dict[str, Any] | None = None,
+                        after_data: dict[str, Any] | None = None,
+                        request_context: dict[str, Any] | None = None,
+                        timestamp: datetime | None = None) -> AuditLog:
+        """
+        Build an unsaved audit log record with provided parameters; timestamp defaults to now.
+        """
         from entity.models.audit import AuditLog
 
         audit_log = AuditLog(
@@ -167,7 +213,7 @@ class AuditService:
             detail_code=detail_code,
             before_value=before_data,
             after_value=after_data,
-            timestamp=timezone.now()
+            timestamp=timestamp or timezone.now()
         )
 
         # Add request context if provided
@@ -176,7 +222,6 @@ class AuditService:
             audit_log.ip_address = request_context.get('ip_address')
             audit_log.user_agent = request_context.get('user_agent')
 
-        audit_log.save()
         return audit_log
 
     @classmethod
@@ -200,3 +245,51 @@ class AuditService:
         return list(AuditLog.objects.filter(
             actor=user
         ).select_related('actor').order_by('-timestamp')[:limit])
+
+
+class AuditBuffer:
+    """
+    Collects audit entries during a write and flushes them with one AuditService.bulk_log call.
+
+    Usage:
+        with AuditBuffer() as audit:
+            audit.log_entity_change(entity_uid=..., operation="INSERT", user=user, after_data={...})
+
+    Entries are discarded if the block raises, so nothing is written for a rolled-back change.
+    """
+
+    def __init__(self) -> None:
+        self.entries: list[dict[str, Any]] = []
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.flush()
+        self.entries = []
+
+    def append(self, **entry: Any) -> None:
+        """Queue one entry with AuditService._create_audit_log parameters."""
+        self.entries.append(entry)
+
+    def log_entity_change(self, **entry: Any) -> None:
+        """Queue a change to the Entity table."""
+        self.append(table_name='entity', **entry)
+
+    def log_detail_change(self, **entry: Any) -> None:
+        """Queue a change to the EntityDetail table."""
+        self.append(table_name='entity_detail', **entry)
+
+    def flush(self) -> list[AuditLog]:
+        """Write queued entries in one INSERT and clear the queue."""
+        if not self.entries:
+            return []
+        audit_logs = AuditService.bulk_log(self.entries)
+        self.entries = []
+        return audit_logs
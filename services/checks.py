@@ -0,0 +1,21 @@
+from typing import Any
+
+from django.conf import settings
+from django.core.checks import Error, register
+
+from services.hash import HashService
+
+
+@register()
+def check_hashservice_algo(**_kwargs: Any) -> list[Error]:
+    """Reject an unknown HASHSERVICE_ALGO at startup instead of on the first hash."""
+    algo = getattr(settings, "HASHSERVICE_ALGO", "sha256")
+    if algo in HashService.ALGORITHMS:
+        return []
+    return [
+        Error(
+            f"Unknown HASHSERVICE_ALGO {algo!r}.",
+            hint=f"Use one of: {', '.join(sorted(HashService.ALGORITHMS))}.",
+            id="services.E001",
+        )
+    ]
@@ -1,10 +1,14 @@
 import zoneinfo
 from datetime import datetime
+from functools import lru_cache
 from typing import Union
 
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 
+# Bound once; every parsed value is normalized to it
+UTC = zoneinfo.ZoneInfo('UTC')
+
 class DateTimeService:
     @staticmethod
     def validate_and_parse(param: Union[str, datetime]) -> datetime:
@@ -12,12 +16,18 @@ class DateTimeService:
         if isinstance(param, datetime):
             # Ensure timezone awareness
             if param.tzinfo is None:
-                param = timezone.make_aware(param, zoneinfo.ZoneInfo('UTC'))
-            return param.astimezone(zoneinfo.ZoneInfo('UTC'))
+                param = timezone.make_aware(param, UTC)
+            return param.astimezone(UTC)
 
         if not isinstance(param, str):
             raise ValueError(f"Parameter must be a string or datetime, got {type(param).__name__}")
 
+        return DateTimeService._parse_string(param)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_string(param: str) -> datetime:
+        """Parse an ISO 8601 string to an aware UTC datetime; memoized since query params repeat across pages."""
         dt = parse_datetime(param)
         if dt is None:
             raise ValueError(
@@ -26,6 +36,6 @@ class DateTimeService:
             )
 
         if dt.tzinfo is None:
-            dt = timezone.make_aware(dt, zoneinfo.ZoneInfo('UTC'))
+            dt = timezone.make_aware(dt, UTC)
 
-        return dt.astimezone(zoneinfo.ZoneInfo('UTC'))
\ No newline at end of file
+        return dt.astimezone(UTC)
\ No newline at end of file
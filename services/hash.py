@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-from typing import Iterable, List, Optional, Union
+from functools import lru_cache
+from typing import Iterable, Optional, Union
+
+from django.conf import settings
 
 
 class HashService:
@@ -10,14 +13,29 @@ class HashService:
     Minimal global hashing utility working with arrays of strings.
 
     - normalize_string(s): trims and lowercases a single string
-    - compute(strings): normalizes list of strings and returns SHA-256 hex digest
+    - compute(strings): normalizes list of strings and returns a 64-char hex digest
     - compare_raw_to_hash(expected_hash, strings): constant-time compare of computed hash vs expected
 
     Notes:
     - For convenience, a single string is also accepted and treated as [string].
     - Strings are concatenated with a '|' delimiter after normalization for determinism.
+    - The algorithm is chosen by settings.HASHSERVICE_ALGO ('sha256' by default, or 'blake2b').
+      Both produce 64 hex chars; switching invalidates stored hashdiffs until they are recomputed.
+    - Digests are memoized in a bounded LRU keyed on the normalized strings and algorithm;
+      cache_clear() empties it.
     """
 
+    # Bound on memoized digests; SCD2 comparisons rehash the same current values on every update
+    DIGEST_CACHE_SIZE = 4096
+
+    # Change detection only, not security: usedforsecurity=False lets FIPS-restricted OpenSSL builds
+    # use their regular implementations
+    ALGORITHMS = {
+        "sha256": lambda payload: hashlib.sha256(payload, usedforsecurity=False),
+        # digest_size=32 keeps the hex digest at 64 chars, matching the hashdiff columns
+        "blake2b": lambda payload: hashlib.blake2b(payload, digest_size=32, usedforsecurity=False),
+    }
+
     @staticmethod
     def normalize_string(s: Optional[str]) -> str:
         if s is None:
@@ -26,20 +44,30 @@ class HashService:
 
     @classmethod
     def compute(cls, strings: Union[str, Iterable[str]]) -> str:
-        """Compute SHA-256 over normalized strings joined by '|'."""
+        """Compute the configured digest over normalized strings joined by '|'."""
         # Backward compatibility: allow single string input
         if isinstance(strings, str):
             strings = [strings]
-        # Ensure list of normalized strings
-        normalized: List[str] = [cls.normalize_string(s) for s in strings]
-        # Deterministic payload
+        # Normalized tuple doubles as the digest cache key
+        normalized = tuple(cls.normalize_string(s) for s in strings)
+        return cls._digest(normalized, getattr(settings, "HASHSERVICE_ALGO", "sha256"))
+
+    @staticmethod
+    @lru_cache(maxsize=DIGEST_CACHE_SIZE)
+    def _digest(normalized: tuple[str, ...], algo: str) -> str:
+        """Digest of the '|'-joined normalized strings; memoized since the same values are rehashed often."""
         payload = "|".join(normalized).encode("utf-8")
-        return hashlib.sha256(payload).hexdigest()
+        return HashService.ALGORITHMS[algo](payload).hexdigest()
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Drop memoized digests."""
+        cls._digest.cache_clear()
 
     @classmethod
     def compare_raw_to_hash(
         cls, expected_hash: str, strings: Union[str, Iterable[str]]
     ) -> bool:
-        """Normalize strings, compute SHA-256 and compare in constant time."""
+        """Normalize strings, compute the digest and compare in constant time."""
         actual = cls.compute(strings)
         return hmac.compare_digest(actual, expected_hash)
@@ -1,13 +1,23 @@
+from collections.abc import Iterable
 from typing import Any
 
 from django.db.models import QuerySet
 from rest_framework.exceptions import NotFound
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.serializers import Serializer
 
 
+class OptionalCursorPagination(CursorPagination):
+    """CursorPagination that treats an empty ?cursor= as a request for the first page."""
+
+    def decode_cursor(self, request: Request) -> Any:
+        if not request.query_params.get(self.cursor_query_param):
+            return None
+        return super().decode_cursor(request)
+
+
 class PaginationService:
     """Service for handling pagination logic across different views."""
 
@@ -16,9 +26,15 @@ class PaginationService:
         queryset: QuerySet | list[Any],
         request: Request,
         serializer_class: type[Serializer],
-        many: bool = True
+        many: bool = True,
+        only_fields: Iterable[str] | None = None
     ) -> Response:
-        """Paginate queryset and return serialized response."""
+        """
+        Paginate queryset and return serialized response.
+
+        `only_fields` restricts a QuerySet to the columns the serializer reads before the page is fetched.
+        """
+        queryset = PaginationService._project(queryset, only_fields)
         paginator = PageNumberPagination()
         try:
             page = paginator.paginate_queryset(queryset, request)
@@ -37,6 +53,44 @@ class PaginationService:
         serializer = serializer_class(queryset, many=many)
         return Response(serializer.data)
 
+    @staticmethod
+    def paginate_queryset_by_cursor(
+        queryset: QuerySet,
+        request: Request,
+        serializer_class: type[Serializer],
+        ordering: str = "-valid_from",
+        many: bool = True,
+        only_fields: Iterable[str] | None = None
+    ) -> Response:
+        """
+        Keyset-paginate queryset and return serialized response.
+
+        The position is an opaque ?cursor= token filtered on `ordering` (an indexed column),
+        so deep pages cost the same as the first one instead of growing with OFFSET.
+        `only_fields` works as in paginate_queryset and must include the ordering column.
+        """
+        queryset = PaginationService._project(queryset, only_fields)
+        paginator = OptionalCursorPagination()
+        paginator.ordering = ordering
+        try:
+            page = paginator.paginate_queryset(queryset, request)
+        except NotFound:
+            return Response({
+                "next": None,
+                "previous": None,
+                "results": [],
+            })
+
+        serializer = serializer_class(page, many=many)
+        return paginator.get_paginated_response(serializer.data)
+
+    @staticmethod
+    def _project(queryset: QuerySet | list[Any], only_fields: Iterable[str] | None) -> QuerySet | list[Any]:
+        """Apply an .only() projection when given one and the input is a QuerySet."""
+        if only_fields and isinstance(queryset, QuerySet):
+            return queryset.only(*only_fields)
+        return queryset
+
     @staticmethod
     def get_paginated_data(
         queryset: QuerySet | list[Any],
@@ -1,3 +1,7 @@
+from collections.abc import Callable
+from datetime import datetime
+from functools import cache
+from operator import attrgetter
 from typing import Any, TypeVar
 
 from django.core.exceptions import ValidationError
@@ -13,41 +17,57 @@ class SCD2Service:
     """Service for SCD Type 2 logic: creates new model version and closes old one."""
 
     # Common SCD2 fields that all models should have
-    COMMON_REQUIRED_FIELDS = {"valid_from", "valid_to", "is_current", "updated_at"}
+    COMMON_REQUIRED_FIELDS = frozenset({"valid_from", "valid_to", "is_current", "updated_at"})
     
+    # Fields never copied into a new version: identity and SCD2 tracking columns
+    EXCLUDED_COPY_FIELDS = frozenset({
+        "id",
+        "pk",
+        "valid_from",
+        "valid_to",
+        "is_current",
+        "created_at",
+        "updated_at",
+    })
+
     # Model-specific required fields
     MODEL_SPECIFIC_FIELDS = {
-        "Entity": {"entity_uid"},
-        "EntityDetail": set(),  # EntityDetail doesn't have entity_uid
+        "Entity": frozenset({"entity_uid"}),
+        "EntityDetail": frozenset(),  # EntityDetail doesn't have entity_uid
     }
 
     @classmethod
     def validate_fields(cls, instance: models.Model) -> None:
         """Validates presence of required fields in model instance."""
         model_name = instance.__class__.__name__
-        required_fields = cls.COMMON_REQUIRED_FIELDS.copy()
-        
-        # Add model-specific fields if defined
-        if model_name in cls.MODEL_SPECIFIC_FIELDS:
-            required_fields.update(cls.MODEL_SPECIFIC_FIELDS[model_name])
-        
         missing_fields = [
-            field for field in required_fields if not hasattr(instance, field)
+            field for field in cls._required_fields(model_name) if not hasattr(instance, field)
         ]
         if missing_fields:
             msg = f"Model {model_name} missing required SCD2 fields: {', '.join(missing_fields)}"
             raise ValidationError(msg)
 
+    @staticmethod
+    @cache
+    def _required_fields(model_name: str) -> frozenset[str]:
+        """Common SCD2 fields plus model-specific ones, combined once per model."""
+        return SCD2Service.COMMON_REQUIRED_FIELDS | SCD2Service.MODEL_SPECIFIC_FIELDS.get(model_name, frozenset())
+
     @classmethod
     def create_new_version(
         cls,
         old_instance: ModelType,
+        now: datetime | None = None,
         **updates: Any,
     ) -> tuple[ModelType, ModelType]:
-        """Creates new version, updates old one, returns both (without saving)."""
+        """
+        Creates new version, updates old one, returns both (without saving).
+
+        `now` is the transition timestamp (old valid_to == new valid_from); defaults to the current time.
+        """
         cls.validate_fields(old_instance)
 
-        now = timezone.now()
+        now = now or timezone.now()
         new_instance = cls._copy_instance(old_instance)
 
         cls.setup_new_version(new_instance, now, updates)
@@ -58,26 +78,36 @@ class SCD2Service:
     @classmethod
     def _copy_instance(cls, instance: ModelType) -> ModelType:
         """Copy all non-SCD2 fields from old instance to new one."""
-        new_instance = type(instance)()
-
-        # Copy all fields except SCD2 tracking fields
-        exclude_fields = {
-            "id",
-            "pk",
-            "valid_from",
-            "valid_to",
-            "is_current",
-            "created_at",
-            "updated_at",
-        }
-
-        for field in instance._meta.fields:
-            if field.name not in exclude_fields:
-                value = getattr(instance, field.name)
-                setattr(new_instance, field.name, value)
+        model_class = type(instance)
+        new_instance = model_class()
+
+        # Copy raw column values (FK ids) so related objects are never fetched. The new instance has no
+        # cached relations yet, so writing __dict__ directly is equivalent to setattr per field
+        new_instance.__dict__.update(
+            zip(cls._copied_attnames(model_class), cls._copied_values_getter(model_class)(instance), strict=True)
+        )
 
         return new_instance
 
+    @staticmethod
+    @cache
+    def _copied_attnames(model_class: type[models.Model]) -> tuple[str, ...]:
+        """Column attnames copied into a new version: every field except SCD2 tracking fields (per model)."""
+        return tuple(
+            field.attname for field in model_class._meta.fields
+            if field.name not in SCD2Service.EXCLUDED_COPY_FIELDS
+        )
+
+    @staticmethod
+    @cache
+    def _copied_values_getter(model_class: type[models.Model]) -> Callable[[models.Model], tuple[Any, ...]]:
+        """One C-level attrgetter reading all copied attnames, always returning a tuple."""
+        attnames = SCD2Service._copied_attnames(model_class)
+        if len(attnames) == 1:
+            getter = attrgetter(attnames[0])
+            return lambda instance: (getter(instance),)
+        return attrgetter(*attnames)
+
     @classmethod
     def setup_new_version(cls, instance: ModelType, now: Any, updates: dict) -> None:
         """Setup SCD2 fields and apply updates to new version."""
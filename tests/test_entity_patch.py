@@ -0,0 +1,96 @@
+from typing import Any
+
+import pytest
+from django.contrib.auth.models import User
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+from entity.models import DetailType, Entity, EntityType
+from entity.services import EntityService
+
+
+@pytest.fixture
+def user(django_user_model: type[User]) -> User:
+    return django_user_model.objects.create_user(username="editor", password="x")
+
+
+@pytest.fixture
+def client(user: User) -> APIClient:
+    api_client = APIClient()
+    api_client.force_authenticate(user)
+    return api_client
+
+
+@pytest.fixture
+def entity(user: User) -> Entity:
+    entity_type = EntityType.objects.create(code="PERSON", name="Person")
+    DetailType.objects.create(code="EMAIL", name="Email")
+    return EntityService().create(
+        {
+            "display_name": "Acme",
+            "entity_type": entity_type,
+            "details": [{"detail_type": "EMAIL", "detail_value": "a@acme.test"}],
+        },
+        user,
+    )
+
+
+def patch(client: APIClient, entity: Entity, body: dict[str, Any]) -> Response:
+    return client.patch(f"/api/v1/entities/{entity.entity_uid}", body, format="json")
+
+
+def version_count(entity: Entity) -> int:
+    return Entity.objects.filter(entity_uid=entity.entity_uid).count()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "body",
+    [
+        {},
+        {"display_name": "Acme"},
+        {"entity_type": "PERSON"},
+        {"display_name": "Acme", "entity_type": "PERSON"},
+    ],
+)
+def test_patch_repeating_current_values_keeps_version(client: APIClient, entity: Entity, body: dict[str, Any]) -> None:
+    response = patch(client, entity, body)
+
+    assert response.status_code == 200
+    assert response.data["display_name"] == "Acme"
+    assert version_count(entity) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"display_name": "Acme Ltd"},
+        {"display_name": "Acme Ltd", "entity_type": "PERSON"},
+    ],
+)
+def test_patch_with_changed_name_creates_version(client: APIClient, entity: Entity, body: dict[str, Any]) -> None:
+    response = patch(client, entity, body)
+
+    assert response.status_code == 200
+    assert response.data["display_name"] == "Acme Ltd"
+    assert response.data["entity_type"] == "PERSON"
+    assert [d["detail_value"] for d in response.data["entity_details"]] == ["a@acme.test"]
+    assert version_count(entity) == 2
+
+
+@pytest.mark.django_db
+def test_patch_with_inactive_entity_type_is_rejected(client: APIClient, entity: Entity) -> None:
+    EntityType.objects.filter(code="PERSON").update(is_active=False)
+
+    response = patch(client, entity, {"display_name": "Acme", "entity_type": "PERSON"})
+
+    assert response.status_code == 400
+    assert version_count(entity) == 1
+
+
+@pytest.mark.django_db
+def test_patch_unknown_entity_is_not_found(client: APIClient) -> None:
+    response = client.patch("/api/v1/entities/00000000-0000-0000-0000-000000000000", {}, format="json")
+
+    assert response.status_code == 404